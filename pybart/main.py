@@ -7,6 +7,7 @@ import pybart
 from pybart import settings
 from pybart.api import BART
 from pybart.draw import EstimateDrawer
+from pybart.stations import get_station_index
 from pybart.utils import Window
 
 
@@ -82,20 +83,30 @@ def open_map(args, parser):
     webbrowser.open_new_tab(settings.BART_MAP_URL)
 
 
+def resolve_stations(bart, stations):
+    """Return the abbreviations of the stations, validating them against the
+    station index before any requests are made for them.
+    """
+    index = get_station_index(bart)
+    return [index.resolve(station) for station in stations]
+
+
 def show_fare(args, parser):
-    root = catch_errors_and_exit(lambda: BART().sched.fare(*args.stations))
+    bart = BART()
+    stations = catch_errors_and_exit(
+        lambda: resolve_stations(bart, args.stations))
+    root = catch_errors_and_exit(lambda: bart.sched.fare(*stations))
     print('$' + root.find('trip').find('fare').text)
 
 
 def list_stations(args, parser):
-    root = catch_errors_and_exit(lambda: BART().stn.stns())
+    index = catch_errors_and_exit(lambda: get_station_index(BART()))
 
     # Format stations with their abbreviations, and find the max station width
     stations = []
     max_station_width = 0
-    for station in root.find('stations').iterfind('station'):
-        station_name = '{name} ({abbr})'.format(
-            name=station.find('name').text, abbr=station.find('abbr').text)
+    for abbr, name in index:
+        station_name = '{name} ({abbr})'.format(name=name, abbr=abbr)
         stations.append(station_name)
         max_station_width = max(max_station_width, len(station_name))
 
@@ -139,8 +150,12 @@ def display_estimates(args, parser):
         parser.print_help()
         exit(1)
 
+    # Validate the stations before starting the display
+    bart = BART()
+    stations = catch_errors_and_exit(lambda: resolve_stations(bart, stations))
+
     with Window(settings.REFRESH_INTERVAL, settings.TOTAL_COLUMNS) as window:
-        drawer = EstimateDrawer(BART(), stations, window)
+        drawer = EstimateDrawer(bart, stations, window)
         char = ''
 
         # Keep running until 'q' is pressed to exit or an error occurs
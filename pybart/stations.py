@@ -0,0 +1,112 @@
+import re
+from difflib import get_close_matches
+
+
+class StationIndex(object):
+    """Local index of BART stations for looking up and validating stations
+    without making a request for each lookup.
+    """
+    MAX_SUGGESTIONS = 3
+
+    abbrs = ()
+    names = ()
+    keys = None
+
+    def __init__(self, stations):
+        """Initialize the index from an iterable of (abbr, name) pairs."""
+        stations = sorted(stations, key=lambda station: station[1].lower())
+        self.abbrs = tuple(abbr for abbr, _ in stations)
+        self.names = tuple(name for _, name in stations)
+
+        # Map lowercase abbreviations and names to their position in the index
+        self.keys = {}
+        for i, (abbr, name) in enumerate(zip(self.abbrs, self.names)):
+            self.keys[abbr.lower()] = i
+            self.keys.setdefault(name.lower(), i)
+
+    @classmethod
+    def from_root(cls, root):
+        """Build the index from the root of a station list response."""
+        return cls(
+            (station.find('abbr').text, station.find('name').text)
+            for station in root.find('stations').iterfind('station'))
+
+    def __iter__(self):
+        """Iterate over the stations as (abbr, name) pairs in name order."""
+        return iter(zip(self.abbrs, self.names))
+
+    def __len__(self):
+        return len(self.abbrs)
+
+    def __contains__(self, query):
+        return query.lower() in self.keys
+
+    def _format(self, i):
+        return '{name} ({abbr})'.format(
+            name=self.names[i], abbr=self.abbrs[i])
+
+    def prefix_matches(self, query):
+        """Return the positions of stations whose abbreviation, name, or any
+        word of their name starts with the query.
+        """
+        query = query.lower()
+        matches = []
+        for i, (abbr, name) in enumerate(zip(self.abbrs, self.names)):
+            name = name.lower()
+            words = [abbr.lower(), name] + re.split(r'\W+', name)
+            if any(word.startswith(query) for word in words):
+                matches.append(i)
+        return matches
+
+    def fuzzy_matches(self, query):
+        """Return the positions of stations with an abbreviation or name
+        similar to the query, with the closest matches first.
+        """
+        matches = []
+        for key in get_close_matches(
+                query.lower(), self.keys, n=self.MAX_SUGGESTIONS * 2):
+            i = self.keys[key]
+            if i not in matches:
+                matches.append(i)
+        return matches[:self.MAX_SUGGESTIONS]
+
+    def resolve(self, query):
+        """Return the abbreviation of the station matching the query.
+
+        Exact abbreviations and names are used first, followed by a unique
+        prefix match. Raise a RuntimeError with suggestions if the query is
+        ambiguous or doesn't match any station.
+        """
+        try:
+            return self.abbrs[self.keys[query.lower()]]
+        except KeyError:
+            pass
+
+        matches = self.prefix_matches(query)
+        if len(matches) == 1:
+            return self.abbrs[matches[0]]
+
+        if matches:
+            error = 'Ambiguous station "{query}".'
+        else:
+            error = 'Unknown station "{query}".'
+            matches = self.fuzzy_matches(query)
+        error = error.format(query=query)
+
+        if matches:
+            error += ' Did you mean: {stations}?'.format(stations=', '.join(
+                self._format(i) for i in matches[:self.MAX_SUGGESTIONS]))
+        raise RuntimeError(error)
+
+
+_index = None
+
+
+def get_station_index(bart):
+    """Return the station index, fetching the station list on first use and
+    sharing the index for the rest of the program.
+    """
+    global _index
+    if _index is None:
+        _index = StationIndex.from_root(bart.stn.stns())
+    return _index